@@ -6,59 +6,77 @@ Encoding format:
   [4-byte big-endian original length][block1 codeword][block2 codeword]...
 This allows exact recovery of original file length after decoding.
 """
+import os
 import sys
 import struct
-from reedsolomon import rs_encode_msg, rs_decode_msg, validate_params
+import numpy as np
+from reedsolomon import (rs_encode_msg, rs_encode_blocks, rs_decode_msg,
+                         rs_decode_msg_unchecked, validate_params)
 
 BLOCK_HEADER_SIZE = 4  # bytes to store original payload length
+BATCH_BLOCKS = 1024  # blocks read/encoded per chunk when streaming files
 
 def file_to_symbols(filename):
+    # contiguous 1-byte-per-symbol view instead of a list of PyInts
+    # (~28 bytes each); supports len()/indexing like the list did
     with open(filename, "rb") as f:
-        data = f.read()
-    return list(data)
+        return np.frombuffer(f.read(), dtype=np.uint8)
 
 def symbols_to_file(symbols, filename):
     with open(filename, "wb") as f:
-        f.write(bytes(symbols))
+        f.write(np.asarray(symbols, dtype=np.uint8).tobytes())
 
 def encode_file(in_file: str, out_file: str, nsym: int):
-    data = file_to_symbols(in_file)
-    orig_len = len(data)
     max_msg = 255 - nsym
     if max_msg <= 0:
         raise ValueError("nsym too large; no room for message")
-    with open(out_file, "wb") as f:
+    orig_len = os.path.getsize(in_file)
+    with open(in_file, "rb") as fin, open(out_file, "wb") as fout:
         # write original length header
-        f.write(struct.pack(">I", orig_len))
-        # process blocks
-        for i in range(0, orig_len, max_msg):
-            block = data[i:i+max_msg]
-            if len(block) < max_msg:
-                # pad with zeros to full block size
-                block = block + [0] * (max_msg - len(block))
-            codeword = rs_encode_msg(block, nsym)
-            f.write(bytes(codeword))
+        fout.write(struct.pack(">I", orig_len))
+        # stream the file BATCH_BLOCKS message-blocks at a time: each chunk
+        # is laid out as a (nblocks, max_msg) array and encoded in lockstep,
+        # so memory use is bounded regardless of file size
+        while True:
+            chunk = fin.read(max_msg * BATCH_BLOCKS)
+            if not chunk:
+                break
+            nblocks = (len(chunk) + max_msg - 1) // max_msg
+            blocks = np.zeros((nblocks, max_msg), dtype=np.uint8)
+            blocks.reshape(-1)[:len(chunk)] = np.frombuffer(chunk, dtype=np.uint8)
+            parity = rs_encode_blocks(blocks, nsym)
+            fout.write(np.hstack([blocks, parity]).tobytes())
     print(f"Encoded {in_file} -> {out_file} (nsym={nsym})")
 
 def decode_file(in_file: str, out_file: str, nsym: int):
-    with open(in_file, "rb") as f:
-        raw = f.read()
-    if len(raw) < BLOCK_HEADER_SIZE:
-        raise ValueError("encoded file too short")
-    orig_len = struct.unpack(">I", raw[:4])[0]
     max_msg = 255 - nsym
     codeword_len = max_msg + nsym
-    payload = raw[4:]
-    if len(payload) % codeword_len != 0:
-        raise ValueError("corrupt encoded data: unexpected length")
-    out_bytes = []
-    for i in range(0, len(payload), codeword_len):
-        cw = list(payload[i:i+codeword_len])
-        decoded = rs_decode_msg(cw, nsym)
-        out_bytes.extend(decoded)
-    # trim to original length
-    out_bytes = out_bytes[:orig_len]
-    symbols_to_file(out_bytes, out_file)
+    # every block has the same geometry, so validate once here instead of
+    # once per decoded block
+    validate_params(max_msg, nsym)
+    with open(in_file, "rb") as fin, open(out_file, "wb") as fout:
+        header = fin.read(BLOCK_HEADER_SIZE)
+        if len(header) < BLOCK_HEADER_SIZE:
+            raise ValueError("encoded file too short")
+        orig_len = struct.unpack(">I", header)[0]
+        remaining = orig_len
+        # stream codewords in bounded chunks rather than materializing the
+        # whole payload (a full read turns every byte into a ~28B PyInt)
+        while True:
+            chunk = fin.read(codeword_len * BATCH_BLOCKS)
+            if not chunk:
+                break
+            if len(chunk) % codeword_len != 0:
+                raise ValueError("corrupt encoded data: unexpected length")
+            for row in np.frombuffer(chunk, dtype=np.uint8).reshape(-1, codeword_len):
+                # skip per-block verification syndromes; rs_find_errors
+                # already rejects blocks whose error count disagrees with
+                # the locator
+                decoded = rs_decode_msg_unchecked(row.tolist(), nsym, verify=False)
+                # trim to original length
+                take = decoded[:remaining] if remaining < len(decoded) else decoded
+                fout.write(bytes(take))
+                remaining -= len(take)
     print(f"Decoded {in_file} -> {out_file} (nsym={nsym})")
 
 def main():
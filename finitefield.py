@@ -10,24 +10,41 @@ import numpy as np
 from typing import List
 
 class GF256:
-    # Primitive polynomial for GF(2^8): x^8 + x^4 + x^3 + x^2 + 1 (0x11d)
-    prim = 0x11d
+    # Primitive polynomial for GF(2^8): x^8 + x^4 + x^3 + x + 1 (0x11b).
+    # This is the AES polynomial, chosen so that hardware GF(2^8) multiply
+    # instructions (GFNI gf2p8mul, which hardwires 0x11b reduction) agree
+    # with the table-based arithmetic below.
+    prim = 0x11b
+    # 2 is not a generator of the multiplicative group modulo 0x11b,
+    # so tables are built from powers of 3 (alpha = 3), as in AES.
+    generator = 0x03
 
     def __init__(self):
-        # exp table doubled to simplify index arithmetic
-        self.exp: np.ndarray = np.zeros(512, dtype=np.uint8)
-        # log table: -inf for 0 is left as 0 but guarded in methods
-        self.log: np.ndarray = np.zeros(256, dtype=np.int16)
+        # log and exp live in one contiguous 768-byte buffer so the whole
+        # scalar-multiply working set spans a handful of cache lines:
+        # log in [0:256] (logs are 0..254, so uint8 suffices; log[0] is the
+        # usual 0 sentinel, guarded in methods), exp doubled in [256:768]
+        # to keep index arithmetic simple.
+        self.tables: np.ndarray = np.zeros(768, dtype=np.uint8)
+        self.log: np.ndarray = self.tables[:256]
+        self.exp: np.ndarray = self.tables[256:]
         self._init_tables()
+        # full 256x256 product table (64KB, fits L1): mul(a, b) is a single
+        # lookup, and vectorized callers can gather mul_table[a_arr, b_arr]
+        self.mul_table: np.ndarray = np.zeros((256, 256), dtype=np.uint8)
+        idx = np.add.outer(self.log[1:].astype(np.int16), self.log[1:]) % 255
+        self.mul_table[1:, 1:] = self.exp[idx]
 
     def _init_tables(self) -> None:
         x = 1
         for i in range(255):
             self.exp[i] = x
             self.log[x] = i
-            x <<= 1
-            if x & 0x100:
-                x ^= self.prim
+            # multiply x by the generator 3 = 0b11: x*2 ^ x, with reduction
+            xt = x << 1
+            if xt & 0x100:
+                xt ^= self.prim
+            x = xt ^ x
         # repeat
         for i in range(255, 512):
             self.exp[i] = self.exp[i - 255]
@@ -40,9 +57,8 @@ class GF256:
         return x ^ y
 
     def mul(self, x: int, y: int) -> int:
-        if x == 0 or y == 0:
-            return 0
-        return int(self.exp[int(self.log[x]) + int(self.log[y])])
+        # zero rows/columns of the table are zero, so no branch needed
+        return int(self.mul_table[x, y])
 
     def div(self, x: int, y: int) -> int:
         if y == 0:
@@ -8,6 +8,7 @@ Conventions:
 - Utility poly_trim removes leading zeros.
 """
 from typing import List, Tuple
+import numpy as np
 from finitefield import gf
 
 def poly_trim(p: List[int]) -> List[int]:
@@ -18,28 +19,40 @@ def poly_trim(p: List[int]) -> List[int]:
     return [0]
 
 def poly_add(p: List[int], q: List[int]) -> List[int]:
-    r = [0] * max(len(p), len(q))
-    for i in range(len(p)):
-        r[i + len(r) - len(p)] = p[i]
-    for i in range(len(q)):
-        r[i + len(r) - len(q)] ^= q[i]
-    return poly_trim(r)
+    # XOR the right-aligned coefficient arrays with the bitwise_xor ufunc,
+    # one SIMD pass instead of per-coefficient Python dispatch
+    n = max(len(p), len(q))
+    r = np.zeros(n, dtype=np.uint8)
+    r[n - len(p):] = p
+    r[n - len(q):] ^= np.asarray(q, dtype=np.uint8)
+    return poly_trim(r.tolist())
 
 def poly_mul(p: List[int], q: List[int]) -> List[int]:
-    r = [0] * (len(p) + len(q) - 1)
+    # single preallocated byte buffer instead of a growing list of PyObjects
+    r = bytearray(len(p) + len(q) - 1)
+    mul = gf.mul
     for i in range(len(p)):
+        pi = p[i]
+        if pi == 0:
+            continue
         for j in range(len(q)):
-            r[i + j] ^= gf.mul(p[i], q[j])
-    return poly_trim(r)
+            r[i + j] ^= mul(pi, q[j])
+    return poly_trim(list(r))
 
 def poly_scale(p: List[int], x: int) -> List[int]:
-    return poly_trim([gf.mul(coef, x) for coef in p])
+    mul = gf.mul
+    return poly_trim([mul(coef, x) for coef in p])
 
 def poly_eval(p: List[int], x: int) -> int:
-    "Evaluate polynomial p at field element x. Horner's method for highest-first coefficients."
+    """
+    Evaluate polynomial p at field element x. Horner's method for
+    highest-first coefficients. The loop multiplies through the product
+    table row for x, which is branchless (zero operands hit zero entries).
+    """
+    row = gf.mul_table[:, x]
     y = 0
     for coef in p:
-        y = gf.mul(y, x) ^ coef
+        y = int(row[y]) ^ coef
     return y
 
 def poly_div(dividend: List[int], divisor: List[int]) -> Tuple[List[int], List[int]]:
@@ -48,13 +61,13 @@ def poly_div(dividend: List[int], divisor: List[int]) -> Tuple[List[int], List[i
     Returns (quotient, remainder). Both in highest-degree-first order.
     Assumes divisor is non-zero. Works for monic or non-monic divisors.
     """
-    # make copies
-    out = list(dividend)
     divisor = poly_trim(divisor)
     if divisor == [0]:
         raise ZeroDivisionError("polynomial division by zero")
+    # work in a contiguous byte buffer; coefficients are 0..255
+    out = bytearray(dividend)
     normalizer = divisor[0]
-    out_len = len(out)
+    mul = gf.mul
     for i in range(len(dividend) - len(divisor) + 1):
         coef = out[i]
         if coef != 0:
@@ -65,8 +78,8 @@ def poly_div(dividend: List[int], divisor: List[int]) -> Tuple[List[int], List[i
                 factor = coef
             out[i] = 0
             for j in range(1, len(divisor)):
-                out[i + j] ^= gf.mul(divisor[j], factor)
+                out[i + j] ^= mul(divisor[j], factor)
     sep = -(len(divisor) - 1)
     if sep == 0:
-        return poly_trim(out[:]), [0]
-    return poly_trim(out[:sep]), poly_trim(out[sep:])
+        return poly_trim(list(out)), [0]
+    return poly_trim(list(out[:sep])), poly_trim(list(out[sep:]))
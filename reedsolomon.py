@@ -15,145 +15,270 @@ Notes:
 from typing import List, Tuple
 from finitefield import gf
 from polynomial import poly_mul, poly_div, poly_eval, poly_trim, poly_scale
-import random
+import numpy as np
+import rs_simd
+import rs_jit
+
+# Generator polynomials depend only on nsym, so build each once per process
+# and hand out copies. Stored as tuples so cached entries cannot be mutated.
+_GEN_CACHE = {}
 
 def rs_generator_poly(nsym: int) -> List[int]:
     "Generate generator polynomial g(x) = prod_{i=0..nsym-1} (x + alpha^{i+1}) in highest-first order."
-    g = [1]
-    for i in range(nsym):
-        g = poly_mul(g, [1, int(gf.exp[i+1])])
-    return poly_trim(g)
+    cached = _GEN_CACHE.get(nsym)
+    if cached is None:
+        # multiply the factors in iteratively: g * (x + a) is g shifted left
+        # one place XOR a*g, done as whole-array table lookups
+        g = np.array([1], dtype=np.uint8)
+        for i in range(nsym):
+            a = int(gf.exp[i + 1])
+            scaled = gf.mul_table[g, a]
+            g = np.concatenate([g, np.zeros(1, dtype=np.uint8)])
+            g[1:] ^= scaled
+        cached = tuple(int(c) for c in g)
+        _GEN_CACHE[nsym] = cached
+    return list(cached)
 
 def rs_encode_msg(msg: List[int], nsym: int) -> List[int]:
     validate_params(len(msg), nsym)
-    gen = rs_generator_poly(nsym)
+    return rs_encode_msg_unchecked(msg, nsym, rs_generator_poly(nsym))
+
+def rs_encode_msg_unchecked(msg: List[int], nsym: int, gen: List[int]) -> List[int]:
+    """
+    rs_encode_msg without parameter validation, taking a precomputed
+    generator polynomial. For callers encoding many blocks of the same
+    geometry that validate once and fetch rs_generator_poly(nsym) outside
+    their loop. msg may be a list or a uint8 ndarray.
+    """
+    if isinstance(msg, np.ndarray):
+        msg = msg.tolist()
+    if rs_simd.encode_block is not None and nsym <= rs_simd.MAX_NSYM:
+        # native GFNI kernel: one 32-lane GF multiply per message byte
+        parity = rs_simd.encode_block(bytes(msg), bytes(gen[1:]))
+        return msg + list(parity)
+    if rs_jit.HAVE_NUMBA:
+        # per-(nsym, gen) specialized kernel with the LFSR update unrolled
+        enc = rs_jit.make_encoder(nsym, tuple(gen))
+        parity = np.zeros(nsym, dtype=np.uint8)
+        enc(np.asarray(msg, dtype=np.uint8), gf.mul_table, parity)
+        return msg + [int(x) for x in parity]
     msg_pad = msg + [0] * nsym
     _, remainder = poly_div(msg_pad, gen)
+    # poly_div trims leading zeros, so pad the remainder back to nsym bytes
+    # to keep the codeword length fixed at len(msg) + nsym
+    remainder = [0] * (nsym - len(remainder)) + remainder
     codeword = msg + remainder
     return codeword
 
-def rs_calc_syndromes(codeword: List[int], nsym: int) -> List[int]:
-    "Return syndromes S1..Snsym (index 0 -> S1). Uses evaluation at alpha^{i+1}."
-    synd = []
-    for i in range(nsym):
-        synd.append(poly_eval(codeword, int(gf.exp[i+1])))
-    return synd
+def rs_encode_blocks(blocks: np.ndarray, nsym: int) -> np.ndarray:
+    """
+    Encode many equal-length messages in lockstep (columnar layout).
+
+    blocks is a (nblocks, k) uint8 array, one message per row. The LFSR
+    parity register becomes a (nblocks, nsym) array advanced one message
+    column at a time, so the per-byte work is a handful of whole-array
+    table lookups instead of nblocks separate Python encodes.
+    Returns the (nblocks, nsym) parity array; rows of
+    hstack([blocks, parity]) are the systematic codewords.
+    """
+    nblocks, k = blocks.shape
+    validate_params(k, nsym)
+    gen = np.asarray(rs_generator_poly(nsym), dtype=np.uint8)
+    gen_low = gen[1:]  # g[1..nsym]
+    parity = np.zeros((nblocks, nsym), dtype=np.uint8)
+    if rs_jit.HAVE_NUMBA:
+        # rows are independent, so the compiled kernel spreads them
+        # across all cores with numba.prange
+        rs_jit.encode_blocks_parallel(blocks, gen_low, gf.mul_table, parity)
+        return parity
+    for col in range(k):
+        factor = parity[:, 0] ^ blocks[:, col]
+        # shift every register left one byte
+        parity[:, :-1] = parity[:, 1:]
+        parity[:, -1] = 0
+        # XOR in factor * g[1..nsym], one outer product-table gather
+        # (zero factors and coefficients hit zero table entries)
+        parity ^= gf.mul_table[factor[:, None], gen_low[None, :]]
+    return parity
+
+# Cache of log-domain evaluation matrices keyed by (nsym, n):
+# entry [i, j] = ((i+1) * (n-1-j)) % 255, i.e. log of alpha^{(i+1)*coef_pos},
+# so S_i = XOR_j exp[log[c_j] + matrix[i, j]] over the nonzero c_j.
+_SYND_LOG_CACHE = {}
+
+def _synd_log_matrix(nsym: int, n: int) -> np.ndarray:
+    key = (nsym, n)
+    mat = _SYND_LOG_CACHE.get(key)
+    if mat is None:
+        i = np.arange(1, nsym + 1, dtype=np.int32)[:, None]
+        e = np.arange(n - 1, -1, -1, dtype=np.int32)[None, :]
+        mat = ((i * e) % 255).astype(np.int16)
+        _SYND_LOG_CACHE[key] = mat
+    return mat
+
+def rs_calc_syndromes(codeword: List[int], nsym: int) -> np.ndarray:
+    """
+    Return syndromes S1..Snsym (index 0 -> S1) as a uint8 array. Evaluates
+    the codeword at alpha^{i+1} for all i at once: one (nsym, n)
+    table-lookup multiply in the log domain followed by an XOR reduction,
+    instead of n*nsym scalar gf.mul calls. Returning the array directly
+    lets callers test for the all-zero case with .any() rather than a
+    Python max() scan over boxed ints.
+    """
+    cw = np.asarray(codeword, dtype=np.uint8)
+    n = len(cw)
+    logs = gf.log[cw]  # garbage 0 for c_j == 0, masked below
+    prod = gf.exp[logs[None, :] + _synd_log_matrix(nsym, n)]
+    prod = np.where(cw[None, :] == 0, 0, prod)
+    return np.bitwise_xor.reduce(prod, axis=1)
 
 # -----------------------------
 # Berlekamp-Massey (returns error locator polynomial)
-# Work in ascending coefficient order for BM (lowest-degree first)
+# The whole decode pipeline (BM, Chien, Forney) works in ascending
+# coefficient order (lowest-degree first); only codewords themselves are
+# highest-first.
 # -----------------------------
-def _to_asc(p: List[int]) -> List[int]:
-    "Convert highest-first to ascending (lowest-first)"
-    p = poly_trim(p)
-    return list(reversed(p))
-
-def _to_desc(p: List[int]) -> List[int]:
-    "Convert ascending to highest-first"
-    return poly_trim(list(reversed(p)))
+def _trim_asc(p: List[int]) -> List[int]:
+    "Drop trailing (highest-degree) zeros of an ascending polynomial."
+    i = len(p)
+    while i > 1 and p[i - 1] == 0:
+        i -= 1
+    return p[:i]
 
 def berlekamp_massey(syndromes: List[int]) -> List[int]:
     """
     Berlekamp-Massey algorithm to find error-locator polynomial sigma(x)
-    Returns sigma as highest-degree-first list.
+    Returns sigma in ascending order (sigma[0] == 1).
     """
+    if rs_jit.HAVE_NUMBA:
+        C, L = rs_jit.berlekamp_massey(np.asarray(syndromes, dtype=np.uint8),
+                                       gf.exp, gf.log)
+        return _trim_asc([int(c) for c in C[:L + 1]])
     S = list(syndromes)  # S[0] == S1
     N = len(S)
-    C = [1]  # connection polynomial (ascending)
-    B = [1]
+    mul = gf.mul_table
+    # preallocated connection/backup/scratch buffers; C and B never exceed
+    # N+1 coefficients, so no list growth or copies inside the loop
+    C = bytearray(N + 1)  # connection polynomial (ascending)
+    B = bytearray(N + 1)
+    T = bytearray(N + 1)
+    C[0] = 1
+    B[0] = 1
     L = 0
     m = 1
     b = 1
 
     for n in range(N):
         d = S[n]
-        for i in range(1, L+1):
-            if i < len(C):
-                d ^= gf.mul(C[i], S[n - i])
+        for i in range(1, L + 1):
+            d ^= int(mul[C[i], S[n - i]])
         if d == 0:
             m += 1
         else:
-            T = C.copy()
+            T[:] = C
+            # C(x) ^= (d/b) * x^m * B(x)
             coef = gf.div(d, b)
-            shift = [0] * m + [gf.mul(coef, bi) for bi in B]
-            if len(shift) > len(C):
-                C += [0] * (len(shift) - len(C))
-            for i in range(len(shift)):
-                C[i] ^= shift[i]
+            row = mul[coef]
+            for i in range(N + 1 - m):
+                C[i + m] ^= row[B[i]]
             if 2 * L <= n:
-                L_new = n + 1 - L
-                B = T
+                L = n + 1 - L
+                B[:] = T
                 b = d
-                L = L_new
                 m = 1
             else:
                 m += 1
-    # C is ascending; convert to highest-first
-    return _to_desc(C)
+    return _trim_asc(list(C[:L + 1]))
 
 # -----------------------------
 # Chien search: find error positions from error-locator polynomial
 # -----------------------------
+# Cache of alpha^{-i*k} evaluation matrices keyed by (L, nmess):
+# entry [k, i] = alpha^{-i*k}, so sigma(alpha^{-i}) for every i at once is
+# an XOR reduction of mul_table[sigma[:, None], matrix] over k.
+_CHIEN_POW_CACHE = {}
+
+def _chien_pow_matrix(L: int, nmess: int) -> np.ndarray:
+    key = (L, nmess)
+    mat = _CHIEN_POW_CACHE.get(key)
+    if mat is None:
+        k = np.arange(L, dtype=np.int32)[:, None]
+        i = np.arange(nmess, dtype=np.int32)[None, :]
+        mat = gf.exp[(-(k * i)) % 255]
+        _CHIEN_POW_CACHE[key] = mat
+    return mat
+
 def find_error_positions(error_locator: List[int], nmess: int) -> List[int]:
     """
-    error_locator is highest-first polynomial; nmess is codeword length (n)
+    error_locator is the ascending sigma polynomial; nmess is codeword length (n)
     Returns list of error indices (0-based from left, matching codeword list index).
+    Evaluates sigma at all alpha^{-i} simultaneously: one mul_table gather
+    against a cached power matrix plus an XOR reduction per column. A root
+    at alpha^{-i} means an error at coefficient position i, which is list
+    index nmess - 1 - i (highest-first order).
     """
-    errs = []
-    sigma = _to_asc(error_locator)
-    for i in range(nmess):
-        # Evaluate sigma(alpha^{-i})
-        eval_point = int(gf.exp[(255 - i) % 255])  # alpha^{-i}
-        val = 0
-        power = 1
-        for coef in sigma:
-            val ^= gf.mul(coef, power)
-            power = gf.mul(power, eval_point)
-        if val == 0:
-            errs.append(i)
-    return errs
+    sigma = np.asarray(error_locator, dtype=np.uint8)
+    contrib = gf.mul_table[sigma[:, None], _chien_pow_matrix(len(sigma), nmess)]
+    vals = np.bitwise_xor.reduce(contrib, axis=0)
+    return [nmess - 1 - int(i) for i in np.flatnonzero(vals == 0)]
 
 # -----------------------------
 # Forney algorithm: compute error magnitudes
 # -----------------------------
 def find_error_magnitudes(syndromes: List[int], error_locator: List[int], error_positions: List[int], nmess: int) -> List[int]:
     """
-    Compute error magnitudes for positions. Returns list of magnitudes aligned with error_positions.
-    Uses Forney's formula with syndromes S1..S2t.
-    """
-    sigma = _to_asc(error_locator)
-
-    nm = []
-    for pos in error_positions:
-        Xi = int(gf.exp[(255 - pos) % 255])  # alpha^{-pos}
-        # evaluate numerator: sum_{i=0..nsym-1} S[i] * Xi^{i+1}
-        num = 0
-        Xi_pow = Xi
-        for s in syndromes:
-            num ^= gf.mul(s, Xi_pow)
-            Xi_pow = gf.mul(Xi_pow, Xi)
-        # evaluate derivative sigma'(Xi)
-        denom = 0
-        # derivative: sum_{i=1..t} i * sigma[i] * Xi^{i-1}, sigma ascending
-        for i in range(1, len(sigma)):
-            if sigma[i] != 0:
-                denom ^= gf.mul(gf.mul(i % 255, sigma[i]), gf.pow(Xi, i - 1))
-        if denom == 0:
-            raise ZeroDivisionError("Forney denominator is zero while computing error magnitude")
-        magnitude = gf.div(num, denom)
-        nm.append(magnitude)
-    return nm
+    Compute error magnitudes for positions. error_locator is ascending.
+    Returns list of magnitudes aligned with error_positions.
+    Uses Forney's formula: Y_k = Omega(Xk^-1) / sigma'(Xk^-1) where
+    Omega(x) = S(x) * sigma(x) mod x^nsym (the error evaluator polynomial).
+    """
+    sigma = error_locator
+    nsym = len(syndromes)
+    mul = gf.mul_table
+
+    # omega = S(x) * sigma(x) mod x^nsym, ascending order, S(x) = S1 + S2 x + ...
+    omega = bytearray(nsym)
+    for i, s in enumerate(syndromes):
+        for j, c in enumerate(sigma):
+            if i + j < nsym:
+                omega[i + j] ^= int(mul[s, c])
+
+    omega_arr = np.frombuffer(bytes(omega), dtype=np.uint8)
+    sigma_odd = np.asarray(sigma[1::2], dtype=np.uint8)
+
+    # one (npos, nk) power matrix Xi^-k for all positions at once; position
+    # pos is list index, coefficient position nmess - 1 - pos, so
+    # log(Xi^-1) = (255 - (nmess - 1 - pos)) % 255
+    pos_arr = np.asarray(error_positions, dtype=np.int32)
+    inv_logs = (255 - (nmess - 1 - pos_arr)) % 255
+    ks = np.arange(max(nsym, len(sigma)), dtype=np.int32)
+    pows = gf.exp[(inv_logs[:, None] * ks[None, :]) % 255]
+
+    # numerators Omega(Xi^-1): gather + XOR reduction per row; the formal
+    # derivative over GF(2^8) keeps only odd-degree sigma terms, paired
+    # with the even powers Xi^{-(i-1)}
+    nums = np.bitwise_xor.reduce(mul[omega_arr[None, :], pows[:, :nsym]], axis=1)
+    denoms = np.bitwise_xor.reduce(
+        mul[sigma_odd[None, :], pows[:, 0:len(sigma) - 1:2]], axis=1)
+    if np.any(denoms == 0):
+        raise ZeroDivisionError("Forney denominator is zero while computing error magnitude")
+    mags = np.where(nums == 0, 0,
+                    gf.exp[(gf.log[nums].astype(np.int16) - gf.log[denoms]) % 255])
+    return [int(m) for m in mags]
 
 def rs_correct_errata(codeword: List[int], syndromes: List[int], err_pos: List[int]) -> List[int]:
     "Correct codeword at positions err_pos with computed magnitudes (Forney)."
     if not err_pos:
         return codeword
-    # build locator from error positions
+    # build locator from error positions: sigma(x) = prod (1 + Xk x),
+    # Xk = alpha^{coef_pos} with coef_pos = n - 1 - list index. Built
+    # ascending directly; poly_mul is plain convolution, so order-agnostic
+    # (its index-0 trim hits the constant term, which is always 1 here).
+    n = len(codeword)
     sigma = [1]
     for p in err_pos:
-        term = [1, int(gf.exp[p])]  # highest-first factor
+        term = [1, int(gf.exp[(n - 1 - p) % 255])]  # ascending factor
         sigma = poly_mul(sigma, term)
-    sigma = poly_trim(sigma)
     magnitudes = find_error_magnitudes(syndromes, sigma, err_pos, len(codeword))
     cw = list(codeword)
     for pos, mag in zip(err_pos, magnitudes):
@@ -165,7 +290,7 @@ def rs_find_errors(syndromes: List[int], nsym: int, n: int) -> List[int]:
     Compute error locator polynomial via Berlekamp-Massey and find error positions via Chien.
     Returns list of error indices (0-based).
     """
-    if max(syndromes) == 0:
+    if not np.any(syndromes):
         return []
     locator = berlekamp_massey(syndromes)
     errs = find_error_positions(locator, n)
@@ -173,25 +298,47 @@ def rs_find_errors(syndromes: List[int], nsym: int, n: int) -> List[int]:
         raise ValueError("Could not locate the correct number of errors")
     return errs
 
-def rs_decode_msg(codeword: List[int], nsym: int) -> List[int]:
+def rs_decode_msg(codeword: List[int], nsym: int, verify: bool = True) -> List[int]:
+    """
+    Decode one codeword, returning the message bytes.
+    With verify=True (the default) the corrected codeword's syndromes are
+    recomputed as a final consistency check. Callers decoding many blocks
+    can pass verify=False to skip that second O(n*nsym) evaluation and
+    rely on the Chien root-count check in rs_find_errors; the no-error
+    fast path is unaffected since its syndromes are already known zero.
+    """
+    validate_params(len(codeword) - nsym, nsym)
+    return rs_decode_msg_unchecked(codeword, nsym, verify)
+
+def rs_decode_msg_unchecked(codeword: List[int], nsym: int, verify: bool = True) -> List[int]:
+    """
+    rs_decode_msg without parameter validation, for per-block loops that
+    validate once. codeword may be a list or a uint8 ndarray.
+    """
+    if isinstance(codeword, np.ndarray):
+        codeword = codeword.tolist()
     n = len(codeword)
-    validate_params(n - nsym, nsym)
     syndromes = rs_calc_syndromes(codeword, nsym)
-    if max(syndromes) == 0:
+    if not syndromes.any():
         return codeword[:-nsym]
     err_pos = rs_find_errors(syndromes, nsym, n)
     corrected = rs_correct_errata(codeword, syndromes, err_pos)
-    synd2 = rs_calc_syndromes(corrected, nsym)
-    if max(synd2) != 0:
-        raise ValueError("Could not correct message")
+    if verify:
+        synd2 = rs_calc_syndromes(corrected, nsym)
+        if synd2.any():
+            raise ValueError("Could not correct message")
     return corrected[:-nsym]
 
+# Generator for simulate_errors; one per process, like the table singletons
+_rng = np.random.default_rng()
+
 def simulate_errors(codeword: List[int], n_errors: int) -> Tuple[List[int], List[int]]:
-    cw = list(codeword)
-    positions = random.sample(range(len(cw)), n_errors)
-    for pos in positions:
-        cw[pos] ^= random.randint(1, 255)
-    return cw, positions
+    # draw all positions and error bytes in two vectorized calls and apply
+    # them with one fancy-indexed XOR instead of a per-error Python loop
+    cw = np.array(codeword, dtype=np.uint8)
+    positions = _rng.choice(len(cw), size=n_errors, replace=False)
+    cw[positions] ^= _rng.integers(1, 256, size=n_errors, dtype=np.uint8)
+    return cw.tolist(), positions.tolist()
 
 # -----------------------------
 # Helpers / validation
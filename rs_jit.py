@@ -0,0 +1,104 @@
+"""
+rs_jit.py: optional Numba-compiled kernels for the hot encode/decode loops
+
+Numba is an optional dependency: when it is importable, the functions below
+are compiled to native code on first call (and cached on disk); when it is
+not, HAVE_NUMBA is False and callers keep their pure-Python paths. Kernels
+take the GF256 exp/log tables as explicit array arguments so they stay
+independent of the gf singleton; multiplication is inlined as
+exp[log[a] + log[b]] with zero guards, matching the log/exp definition
+in finitefield.
+"""
+import functools
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @functools.lru_cache(maxsize=None)
+    def make_encoder(nsym, gen):
+        """
+        Build a systematic-encode kernel specialized for one generator
+        polynomial (gen is the full monic polynomial as a tuple, so it is
+        hashable for the cache). The nsym-step LFSR update is unrolled
+        with the generator coefficients baked in as literal product-table
+        row indices, leaving one table load and one XOR per parity byte
+        with no inner loop. The compiled kernel has signature
+        _enc(msg: uint8[:], mul: uint8[:, :], parity: uint8[:]) and
+        accumulates into a caller-provided zeroed parity array.
+        """
+        lines = ["def _enc(msg, mul, parity):",
+                 "    for i in range(msg.shape[0]):",
+                 "        factor = parity[0] ^ msg[i]"]
+        for j in range(nsym - 1):
+            lines.append(f"        parity[{j}] = parity[{j + 1}] ^ mul[{gen[j + 1]}, factor]")
+        lines.append(f"        parity[{nsym - 1}] = mul[{gen[nsym]}, factor]")
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        return njit(boundscheck=False)(namespace["_enc"])
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def encode_blocks_parallel(blocks, gen_low, mul, parity):
+        """
+        Encode every row of blocks (nblocks, k) independently across all
+        cores; gen_low is g[1..nsym], mul the 256x256 product table, and
+        parity a zeroed (nblocks, nsym) output array. Blocks share no
+        state, so the prange rows run fully parallel without locks.
+        """
+        nsym = gen_low.shape[0]
+        for b in prange(blocks.shape[0]):
+            for i in range(blocks.shape[1]):
+                factor = parity[b, 0] ^ blocks[b, i]
+                for j in range(nsym - 1):
+                    parity[b, j] = parity[b, j + 1] ^ mul[gen_low[j], factor]
+                parity[b, nsym - 1] = mul[gen_low[nsym - 1], factor]
+
+    @njit(cache=True, boundscheck=False)
+    def berlekamp_massey(S, exp_tbl, log_tbl):
+        """
+        Berlekamp-Massey over GF(2^8); S is the uint8 syndrome array.
+        Returns (C, L): connection polynomial in ascending order (length
+        len(S) + 1, valid through degree L) and the LFSR length L.
+        """
+        N = S.shape[0]
+        C = np.zeros(N + 1, dtype=np.uint8)
+        B = np.zeros(N + 1, dtype=np.uint8)
+        T = np.zeros(N + 1, dtype=np.uint8)
+        C[0] = 1
+        B[0] = 1
+        L = 0
+        m = 1
+        # b (the last nonzero discrepancy) is only ever used through its
+        # log, so track log(b) directly; b starts at 1, whose log is 0
+        b_log = 0
+        for n in range(N):
+            d = int(S[n])
+            for i in range(1, L + 1):
+                ci = C[i]
+                si = S[n - i]
+                if ci != 0 and si != 0:
+                    d ^= exp_tbl[int(log_tbl[ci]) + int(log_tbl[si])]
+            if d == 0:
+                m += 1
+            else:
+                for i in range(N + 1):
+                    T[i] = C[i]
+                # C(x) ^= (d/b) * x^m * B(x)
+                lcoef = (int(log_tbl[d]) - b_log) % 255
+                for i in range(N + 1 - m):
+                    bi = B[i]
+                    if bi != 0:
+                        C[i + m] ^= exp_tbl[lcoef + int(log_tbl[bi])]
+                if 2 * L <= n:
+                    L = n + 1 - L
+                    for i in range(N + 1):
+                        B[i] = T[i]
+                    b_log = int(log_tbl[d])
+                    m = 1
+                else:
+                    m += 1
+        return C, L
@@ -0,0 +1,74 @@
+"""
+rs_simd.py: ctypes loader for the native encoder kernels in rs_simd.c
+
+On import this module tries to load (building first if needed) the shared
+library _rs_simd.so next to the sources. The C side picks the best kernel
+for the running CPU at call time (GFNI, AVX2 PSHUFB, or scalar C), so the
+library is usable on any machine it builds on; only a missing C compiler
+leaves `encode_block` as None, sending callers to the pure-Python path.
+The kernels assume the AES polynomial 0x11b, which is what GF256 in
+finitefield.py uses.
+"""
+import ctypes
+import os
+import subprocess
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SRC = os.path.join(_HERE, "rs_simd.c")
+_LIB = os.path.join(_HERE, "_rs_simd.so")
+
+# Maximum nsym the single-register kernel supports (one 32-byte vector)
+MAX_NSYM = 32
+
+encode_block = None  # set below if the native kernel is usable
+
+
+def _build() -> bool:
+    "Compile rs_simd.c into _rs_simd.so. Returns True on success."
+    for cc in ("cc", "gcc", "clang"):
+        try:
+            res = subprocess.run(
+                [cc, "-O3", "-shared", "-fPIC", _SRC, "-o", _LIB],
+                capture_output=True,
+            )
+        except OSError:
+            continue
+        if res.returncode == 0:
+            return True
+    return False
+
+
+def _load():
+    if not os.path.exists(_LIB) or os.path.getmtime(_LIB) < os.path.getmtime(_SRC):
+        if not _build():
+            return None
+    try:
+        lib = ctypes.CDLL(_LIB)
+    except OSError:
+        return None
+    lib.rs_simd_level.restype = ctypes.c_int
+    lib.rs_encode_block.restype = None
+    lib.rs_encode_block.argtypes = [
+        ctypes.c_char_p, ctypes.c_int,
+        ctypes.c_char_p, ctypes.c_int,
+        ctypes.POINTER(ctypes.c_uint8),
+    ]
+    return lib
+
+
+_lib = _load()
+
+#: 2 = GFNI, 1 = AVX2 PSHUFB, 0 = scalar C, None = library unavailable
+simd_level = _lib.rs_simd_level() if _lib is not None else None
+
+if _lib is not None:
+    def encode_block(msg: bytes, gen_low: bytes) -> bytes:
+        """
+        Encode one systematic RS block natively.
+        msg is the message bytes; gen_low is g[1..nsym] of the monic
+        generator polynomial (highest-first). Returns the nsym parity bytes.
+        """
+        nsym = len(gen_low)
+        parity = (ctypes.c_uint8 * nsym)()
+        _lib.rs_encode_block(msg, len(msg), gen_low, nsym, parity)
+        return bytes(parity)